@@ -79,6 +79,7 @@ def test_invalid_base64(example_json_keyfile):
         "SGVsbG8gV29ybGQ",  # Incorrect padding
         "Invalid#Base64",
         12345,  # Not a string or bytes
+        {"type": "service_account"},  # An already decoded keyfile
         b"Invalid#Base64",
         "H\xffGVsbG8gV29ybGQh",  # Contains invalid character \xff
         example_json_keyfile,
@@ -224,6 +224,7 @@ class TestBigQueryAdapterAcquire(BaseTestBigQueryAdapter):
         self, mock_open_connection, mock_get_bigquery_defaults
     ):
         adapter = self.get_adapter("oauth-no-project")
+        self.assertEqual(adapter.config.credentials.database, "project_id")
         mock_get_bigquery_defaults.assert_called_once()
         try:
             connection = adapter.acquire_connection("dummy")
@@ -267,6 +268,7 @@ class TestBigQueryAdapterAcquire(BaseTestBigQueryAdapter):
         self, mock_open_connection, mock_get_bigquery_defaults
     ):
         adapter = self.get_adapter("dataproc-serverless-configured")
+        self.assertEqual(adapter.config.credentials.database, "project_id")
         mock_get_bigquery_defaults.assert_called_once()
         try:
             connection = adapter.acquire_connection("dummy")
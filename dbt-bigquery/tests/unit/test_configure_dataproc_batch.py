@@ -17,6 +17,7 @@ class TestConfigureDataprocBatch(BaseTestBigQueryAdapter):
     )
     def test_update_dataproc_serverless_batch(self, mock_get_bigquery_defaults):
         adapter = self.get_adapter("dataproc-serverless-configured")
+        self.assertEqual(adapter.config.credentials.database, "project_id")
         mock_get_bigquery_defaults.assert_called_once()
 
         credentials = adapter.acquire_connection("dummy").credentials
@@ -69,6 +70,7 @@ class TestConfigureDataprocBatch(BaseTestBigQueryAdapter):
     )
     def test_default_dataproc_serverless_batch(self, mock_get_bigquery_defaults):
         adapter = self.get_adapter("dataproc-serverless-default")
+        self.assertEqual(adapter.config.credentials.database, "project_id")
         mock_get_bigquery_defaults.assert_called_once()
 
         credentials = adapter.acquire_connection("dummy").credentials